@@ -13,8 +13,10 @@ Output:
     - data/child_care_providers_YYYY-MM-DD.csv
 """
 
+import os
 import requests
 import sys
+import tempfile
 from datetime import date
 from pathlib import Path
 
@@ -25,6 +27,9 @@ from test_parse_consistency import run_all_tests
 # URL for the Child Care Roster PDF
 PDF_URL = "https://dhhs.ne.gov/licensure/Documents/ChildCareRoster.pdf"
 
+# Bytes read from the response per write while downloading
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 def download_pdf(url, output_path):
     """
@@ -35,13 +40,28 @@ def download_pdf(url, output_path):
     print(f"Downloading PDF from {url}...")
 
     try:
-        response = requests.get(url, timeout=60)
-        response.raise_for_status()
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the response to disk in chunks rather than holding the whole
+        # PDF in memory.  Write to a temporary file next to output_path and
+        # only move it into place once the body is complete, so a dropped
+        # connection never leaves a truncated PDF behind.
+        with requests.get(url, timeout=60, stream=True) as response:
+            response.raise_for_status()
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(
+                'wb', dir=output_path.parent, suffix='.part', delete=False
+            ) as f:
+                tmp_path = Path(f.name)
+                try:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                except BaseException:
+                    f.close()
+                    tmp_path.unlink()
+                    raise
+
+            os.replace(tmp_path, output_path)
 
         print(f"Saved PDF to {output_path}")
         return True
@@ -15,8 +15,13 @@ Usage:
 
 import pdfplumber
 import csv
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
 
 
@@ -45,12 +50,72 @@ FACILITY_TYPES = [
     'Preschool',
 ]
 
+# Page header lines repeated at the top of every page.  Each one starts the
+# line, so a prefix check is enough to skip them.
+_SKIP_PREFIXES = (
+    'CHILD CARE LICENSING ROSTER',
+    'Date of Printing:',
+    'ZIP CODE',
+    'PROVIDER NAME',
+    'OWNER NAME',
+    'PHONE NUMBER',
+)
+
+# Number of pages each worker process extracts per task
+PAGES_PER_WORKER_TASK = 20
+
+# Precompiled patterns used by the extractors below.  These run for every line
+# of every page, so compile them once rather than going through the re cache.
+# google-re2 was tried for the hot patterns but its per-call binding overhead
+# made a full parse slower on these short lines, so they stay on re.
+_LICENSE_RE = re.compile(r'\b(FII?\d+|CCC\d+|PRE\d+|SAOC\d+)\b')
+_CAPACITY_RE = re.compile(r'Capacity:\s*(\d+)')
+_CAPACITY_LABEL_RE = re.compile(r'\s*Capacity:')
+_DAYS_RE = re.compile(r'Days of Week Open:\s*([A-Z]+)')
+_AGES_RE = re.compile(r'Ages:\s*(.+?)(?:\s*$)')
+_HOURS_RE = re.compile(r'Hours:\s*(\d{4})\s*To\s*(\d{4})')
+_PHONE_RE = re.compile(r'^\((\d{3})\)\s*(\d{3})-?(\d{4})')
+_DATE_RE = re.compile(r'\b(\d{2}/\d{2}/\d{4})\b')
+_CITYSTATEZIP_RE = re.compile(r'\b([A-Za-z][A-Za-z\s\.]{0,30}?)\s+NE\s+(\d{5})\b')
+_ZIP_HEADER_RE = re.compile(r'^(\d{5})\s+([A-Za-z]+)\s*$')
+_STEPUP_RE = re.compile(r'Step Up To Quality:\s*(\d+)?')
+_ACCREDITED_RE = re.compile(r'Accredited\?\s*([YN])?')
+
+# Fields parse_provider_block looks for on any line of a block, fused into one
+# alternation so each line is scanned once.  A hit only says which field the
+# line carries; the field's own extractor pulls out the value.
+_BLOCK_FIELDS_RE = re.compile(
+    r'(?P<hours>Hours:\s*\d{4}\s*To\s*\d{4})'
+    r'|(?P<date>\b\d{2}/\d{2}/\d{4}\b)'
+    r'|(?P<phone>^\(\d{3}\)\s*\d{3}-?\d{4})'
+    r'|(?P<city>\sNE\s+\d{5}\b)'
+    r'|(?P<question>Currently Accepts Subsidy\?|Willing To Accept Subsidy\?'
+    r'|Does Not Accept Subsidy\?|Step Up To Quality:|Accredited\?)'
+)
+
+# Provider name cleanup
+_OWNED_BY_RE = re.compile(r'^(.+?)\s+owned by\s+', re.IGNORECASE)
+_OWNED_BY_SUFFIX_RE = re.compile(r'\s+owned by\s*$', re.IGNORECASE)
+_OWNED_BY_UPPER_SUFFIX_RE = re.compile(r'\s+OWNED BY\s*$')
+_OWNED_SUFFIX_RE = re.compile(r'\s+owned\s*$', re.IGNORECASE)
+_OB_SUFFIX_RE = re.compile(r'\s+ob\s*$', re.IGNORECASE)
+
+# City text normalisation
+_DOTTED_CAPITAL_RE = re.compile(r'([A-Z])\.([a-z])')
+_DOTTED_LLC_RE = re.compile(r'\bL\.L\.C\.?')
+_CAPS_TITLE_RE = re.compile(r'([A-Z]{2,})([A-Z][a-z])')
+_SUFFIX_TITLE_RE = re.compile(r'\b(LLC|INC|CORP|LTD)([A-Z][a-z])')
+_NEBRASKA_RE = re.compile(r'\bNEBR[A-Za-z]+\b(?=\s)', re.IGNORECASE)
+_BUSINESS_SUFFIX_RE = re.compile(r'\b(LLC|INC|CORP|LTD|DBA)\b\.?\s*', re.IGNORECASE)
+_CITY_OF_RE = re.compile(r'^(CITY\s+OF|OF)\s+', re.IGNORECASE)
+_ALL_CAPS_WORD_RE = re.compile(r'^[A-Z][A-Z.]*$')
+
 
 def extract_license_number(text):
     """
     Extract license number from text (e.g., FI12640, CCC9578, PRE9025).
     """
-    match = re.search(r'\b(FII?\d+|CCC\d+|PRE\d+|SAOC\d+)\b', text)
+    match = _LICENSE_RE.search(text)
     return match.group(1) if match else ''
 
 
@@ -58,7 +123,7 @@ def extract_capacity(text):
     """
     Extract capacity from text like 'Capacity: 10'.
     """
-    match = re.search(r'Capacity:\s*(\d+)', text)
+    match = _CAPACITY_RE.search(text)
     return match.group(1) if match else ''
 
 
@@ -66,7 +131,7 @@ def extract_days(text):
     """
     Extract days of week from text like 'Days of Week Open: MTWTHF'.
     """
-    match = re.search(r'Days of Week Open:\s*([A-Z]+)', text)
+    match = _DAYS_RE.search(text)
     return match.group(1) if match else ''
 
 
@@ -74,7 +139,7 @@ def extract_ages(text):
     """
     Extract ages from text like 'Ages: 6 WKS To 13 YRS'.
     """
-    match = re.search(r'Ages:\s*(.+?)(?:\s*$)', text)
+    match = _AGES_RE.search(text)
     return match.group(1).strip() if match else ''
 
 
@@ -82,7 +147,7 @@ def extract_hours(text):
     """
     Extract hours from text like 'Hours: 0600 To 1800'.
     """
-    match = re.search(r'Hours:\s*(\d{4})\s*To\s*(\d{4})', text)
+    match = _HOURS_RE.search(text)
     if match:
         return f"{match.group(1)} To {match.group(2)}"
     return ''
@@ -92,7 +157,7 @@ def extract_phone(text):
     """
     Extract phone number from text.
     """
-    match = re.match(r'^\((\d{3})\)\s*(\d{3})-?(\d{4})', text)
+    match = _PHONE_RE.match(text)
     if match:
         return f"({match.group(1)}) {match.group(2)}-{match.group(3)}"
     return ''
@@ -102,7 +167,7 @@ def extract_effective_date(text):
     """
     Extract effective date from text like '04/30/2024'.
     """
-    match = re.search(r'\b(\d{2}/\d{2}/\d{4})\b', text)
+    match = _DATE_RE.search(text)
     return match.group(1) if match else ''
 
 
@@ -118,23 +183,23 @@ def extract_city_state_zip(text):
     # 'L'+'.'+'e' at the LLC/city boundary -> "L.L.CLexington".
     # (No word-boundary anchor so we catch the case where 'L' follows directly
     # after another word-char such as after 'C' in "L.L.CL.exington".)
-    text = re.sub(r'([A-Z])\.([a-z])', r'\1\2', text)
+    text = _DOTTED_CAPITAL_RE.sub(r'\1\2', text)
 
     # Normalize dotted LLC form: "L.L.C." / "L.L.C" -> "LLC"
     # Must run after the period-removal step above so "L.L.CLexington"
     # (produced by the previous step) becomes "LLCLexington".
-    text = re.sub(r'\bL\.L\.C\.?', 'LLC', text)
+    text = _DOTTED_LLC_RE.sub('LLC', text)
 
     # Split ALL-CAPS text that is directly concatenated with a Title-Case word
     # (PDF column-merge artifact), e.g. "CHRISTOmaha" -> "CHRIST Omaha"
-    text = re.sub(r'([A-Z]{2,})([A-Z][a-z])', r'\1 \2', text)
+    text = _CAPS_TITLE_RE.sub(r'\1 \2', text)
 
     # Split business suffix concatenated directly with a Title-Case city name,
     # e.g. "LLCSeward" -> "LLC Seward"
-    text = re.sub(r'\b(LLC|INC|CORP|LTD)([A-Z][a-z])', r'\1 \2', text)
+    text = _SUFFIX_TITLE_RE.sub(r'\1 \2', text)
 
     # Pattern: City Name NE ZIPCODE
-    match = re.search(r'\b([A-Za-z][A-Za-z\s\.]{0,30}?)\s+NE\s+(\d{5})\b', text)
+    match = _CITYSTATEZIP_RE.search(text)
     if match:
         city = _clean_city(match.group(1).strip())
         if city:
@@ -152,13 +217,21 @@ def extract_facility_type(text):
     return ''
 
 
+@lru_cache(maxsize=16)
+def _yn_pattern(prefix):
+    """
+    Return the compiled pattern matching a Y/N answer after the given prefix.
+    """
+    return re.compile(re.escape(prefix) + r'\s*([YN])?')
+
+
 def extract_yn_value(line, prefix):
     """
     Extract Y/N value from a line like 'Currently Accepts Subsidy? Y'.
     """
     if prefix in line:
         # Look for Y or N after the prefix
-        match = re.search(rf'{re.escape(prefix)}\s*([YN])?', line)
+        match = _yn_pattern(prefix).search(line)
         if match and match.group(1):
             return match.group(1)
     return ''
@@ -168,7 +241,7 @@ def extract_step_up_quality(line):
     """
     Extract Step Up To Quality rating from line.
     """
-    match = re.search(r'Step Up To Quality:\s*(\d+)?', line)
+    match = _STEPUP_RE.search(line)
     if match and match.group(1):
         return match.group(1)
     return ''
@@ -178,21 +251,22 @@ def extract_accredited(line):
     """
     Extract accreditation status from line.
     """
-    match = re.search(r'Accredited\?\s*([YN])?', line)
+    match = _ACCREDITED_RE.search(line)
     if match and match.group(1):
         return match.group(1)
     return ''
 
 
+@lru_cache(maxsize=4096)
 def clean_provider_name(name):
     """
     Clean up provider name by removing trailing 'owned by' or 'OWNED BY' fragments.
     """
     # Remove trailing "owned by" or partial fragments
-    name = re.sub(r'\s+owned by\s*$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s+OWNED BY\s*$', '', name)
-    name = re.sub(r'\s+owned\s*$', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'\s+ob\s*$', '', name, flags=re.IGNORECASE)  # partial "owned by" -> "ob"
+    name = _OWNED_BY_SUFFIX_RE.sub('', name)
+    name = _OWNED_BY_UPPER_SUFFIX_RE.sub('', name)
+    name = _OWNED_SUFFIX_RE.sub('', name)
+    name = _OB_SUFFIX_RE.sub('', name)  # partial "owned by" -> "ob"
     return name.strip()
 
 
@@ -209,23 +283,23 @@ def _clean_city(city):
 
     # Fix ALL-CAPS text concatenated directly with a Title-Case word (PDF column
     # merge artifact).  e.g. "CHRISTOmaha" -> "CHRIST Omaha"
-    city = re.sub(r'([A-Z]{2,})([A-Z][a-z])', r'\1 \2', city)
+    city = _CAPS_TITLE_RE.sub(r'\1 \2', city)
 
     # Fix business suffix concatenated directly with city (no space).
     # e.g. "LLCSeward" -> "LLC Seward"
-    city = re.sub(r'\b(LLC|INC|CORP|LTD)([A-Z][a-z])', r'\1 \2', city)
+    city = _SUFFIX_TITLE_RE.sub(r'\1 \2', city)
 
     # Strip standalone NEBRASKA/NEBR... prefix (any case, followed by whitespace).
     # e.g. "NEBRAKSA North Platte" -> "North Platte", "Nebraska LINCOLN" -> "LINCOLN"
     # Only when followed by whitespace so we don't blank-out concatenated forms
     # like "NEBRASKASCOTTSBLUFF" that require deeper PDF-parsing fixes.
-    city = re.sub(r'\bNEBR[A-Za-z]+\b(?=\s)', '', city, flags=re.IGNORECASE).strip()
+    city = _NEBRASKA_RE.sub('', city).strip()
 
     # Strip business suffixes (whole words, case-insensitive)
-    city = re.sub(r'\b(LLC|INC|CORP|LTD|DBA)\b\.?\s*', '', city, flags=re.IGNORECASE).strip()
+    city = _BUSINESS_SUFFIX_RE.sub('', city).strip()
 
     # Strip "CITY OF" or lone "OF" at the start of the city string
-    city = re.sub(r'^(CITY\s+OF|OF)\s+', '', city, flags=re.IGNORECASE).strip()
+    city = _CITY_OF_RE.sub('', city).strip()
 
     # Deduplicate repeated city name (e.g. "COZAD Cozad", "FREMONT Fremont",
     # "OMAHA OMAHA", "GRAND ISLAND Grand Island").  Keep the last (often
@@ -244,7 +318,7 @@ def _clean_city(city):
             and words[-1][0].isupper()
             and len(words[-1]) > 1
             and words[-1][1].islower()):
-        while len(words) > 1 and re.match(r'^[A-Z][A-Z.]*$', words[0]):
+        while len(words) > 1 and _ALL_CAPS_WORD_RE.match(words[0]):
             words.pop(0)
         city = ' '.join(words)
 
@@ -259,120 +333,161 @@ def _clean_city(city):
     return city.strip()
 
 
+@dataclass(slots=True)
+class Provider:
+    """
+    One provider record.  Fields are in CSV column order (see CSV_FIELDNAMES).
+    """
+    download_date: str = ''
+    zip_code: str = ''
+    county: str = ''
+    provider_name: str = ''
+    license_number: str = ''
+    license_type: str = ''
+    owner_name: str = ''
+    effective_date: str = ''
+    address: str = ''
+    city: str = ''
+    state: str = 'NE'
+    phone: str = ''
+    capacity: str = ''
+    ages: str = ''
+    hours: str = ''
+    days_open: str = ''
+    currently_accepts_subsidy: str = ''
+    willing_to_accept_subsidy: str = ''
+    does_not_accept_subsidy: str = ''
+    step_up_quality: str = ''
+    accredited: str = ''
+
+
+# Provider attribute names in CSV column order, and a getter for a record's row
+PROVIDER_FIELDS = tuple(field.name for field in fields(Provider))
+_provider_row = attrgetter(*PROVIDER_FIELDS)
+
+# CSV column headers.  Rows are written by position from PROVIDER_FIELDS, so
+# each header must name the Provider attribute in the same position.
+CSV_FIELDNAMES = (
+    'Download_Date', 'Zip_Code', 'County', 'Provider_Name', 'License_Number',
+    'License_Type', 'Owner_Name', 'Effective_Date', 'Address', 'City', 'State',
+    'Phone', 'Capacity', 'Ages', 'Hours', 'Days_Open',
+    'Currently_Accepts_Subsidy', 'Willing_To_Accept_Subsidy',
+    'Does_Not_Accept_Subsidy', 'Step_Up_Quality', 'Accredited',
+)
+assert tuple(name.lower() for name in CSV_FIELDNAMES) == PROVIDER_FIELDS, \
+    "CSV_FIELDNAMES is out of sync with the Provider fields"
+
+
+# Question text found by _BLOCK_FIELDS_RE -> (Provider attribute, extractor)
+_QUESTION_FIELDS = {
+    'Currently Accepts Subsidy?': (
+        'currently_accepts_subsidy', partial(extract_yn_value, prefix='Currently Accepts Subsidy?')),
+    'Willing To Accept Subsidy?': (
+        'willing_to_accept_subsidy', partial(extract_yn_value, prefix='Willing To Accept Subsidy?')),
+    'Does Not Accept Subsidy?': (
+        'does_not_accept_subsidy', partial(extract_yn_value, prefix='Does Not Accept Subsidy?')),
+    'Step Up To Quality:': ('step_up_quality', extract_step_up_quality),
+    'Accredited?': ('accredited', extract_accredited),
+}
+
+
+# Provider attributes parse_provider_block fills in from any line of a block
+_BLOCK_SCAN_FIELDS = ('city', 'hours', 'effective_date', 'phone') + tuple(
+    field for field, _ in _QUESTION_FIELDS.values()
+)
+
+
 def parse_provider_block(lines, current_zip, current_county, download_date=''):
     """
     Parse a block of lines representing a single provider.
-    Returns a dictionary with provider data.
-    """
-    provider = {
-        'Download_Date': download_date,
-        'Zip_Code': current_zip,
-        'County': current_county,
-        'Provider_Name': '',
-        'License_Number': '',
-        'License_Type': '',
-        'Owner_Name': '',
-        'Effective_Date': '',
-        'Address': '',
-        'City': '',
-        'State': 'NE',
-        'Phone': '',
-        'Capacity': '',
-        'Ages': '',
-        'Hours': '',
-        'Days_Open': '',
-        'Currently_Accepts_Subsidy': '',
-        'Willing_To_Accept_Subsidy': '',
-        'Does_Not_Accept_Subsidy': '',
-        'Step_Up_Quality': '',
-        'Accredited': '',
-    }
+    Returns a Provider record.
+    """
+    provider = Provider(download_date=download_date, zip_code=current_zip, county=current_county)
 
     if not lines:
         return provider
 
-    # Combine all lines for searching
-    all_text = ' '.join(lines)
-
     # Line 1: Provider Name, License Number, Address, Capacity, Days
     line1 = lines[0] if len(lines) > 0 else ''
 
     # Extract license number first
-    provider['License_Number'] = extract_license_number(line1)
-    provider['Capacity'] = extract_capacity(line1)
-    provider['Days_Open'] = extract_days(line1)
+    provider.license_number = extract_license_number(line1)
+    provider.capacity = extract_capacity(line1)
+    provider.days_open = extract_days(line1)
 
     # Extract address (between license number and Capacity)
-    if provider['License_Number']:
-        parts = line1.split(provider['License_Number'])
+    if provider.license_number:
+        parts = line1.split(provider.license_number)
         if len(parts) >= 2:
             # Provider name is before license number
             name_part = parts[0].strip()
             # Remove "owned by..." suffix from provider name
-            owned_match = re.search(r'^(.+?)\s+owned by\s+', name_part, re.IGNORECASE)
+            owned_match = _OWNED_BY_RE.search(name_part)
             if owned_match:
-                provider['Provider_Name'] = clean_provider_name(owned_match.group(1))
+                provider.provider_name = clean_provider_name(owned_match.group(1))
             else:
-                provider['Provider_Name'] = clean_provider_name(name_part)
+                provider.provider_name = clean_provider_name(name_part)
 
             # Address is between license number and Capacity
             after_license = parts[1]
-            cap_match = re.search(r'\s*Capacity:', after_license)
+            cap_match = _CAPACITY_LABEL_RE.search(after_license)
             if cap_match:
-                provider['Address'] = after_license[:cap_match.start()].strip()
+                provider.address = after_license[:cap_match.start()].strip()
 
     # Line 2: (continuation of owner), License Type, Ages
     line2 = lines[1] if len(lines) > 1 else ''
-    provider['License_Type'] = extract_facility_type(line2)
-    provider['Ages'] = extract_ages(line2)
-
-    # Look for city/state/zip in any line (since text can get mangled)
+    provider.license_type = extract_facility_type(line2)
+    provider.ages = extract_ages(line2)
+
+    # Scan every line once for the fields that can turn up anywhere in the
+    # block (text can get mangled across columns).  Each field keeps the first
+    # value found, so later lines only fill in what is still missing, and the
+    # scan stops as soon as nothing is.
+    needs = set(_BLOCK_SCAN_FIELDS)
     for line in lines:
-        if not provider['City']:
+        if not needs:
+            break
+
+        found = set()
+        questions = []
+        for match in _BLOCK_FIELDS_RE.finditer(line):
+            found.add(match.lastgroup)
+            if match.lastgroup == 'question':
+                questions.append(match.group())
+        if not found:
+            continue
+
+        if 'city' in found and 'city' in needs:
             city, state, zip_code = extract_city_state_zip(line)
             if city:
-                provider['City'] = city
+                provider.city = city
+                needs.discard('city')
 
-    # Look for hours in any line
-    for line in lines:
-        if not provider['Hours']:
-            hours = extract_hours(line)
-            if hours:
-                provider['Hours'] = hours
-                break
+        if 'hours' in found and 'hours' in needs:
+            provider.hours = extract_hours(line)
+            needs.discard('hours')
 
-    # Look for effective date and owner name
-    for line in lines:
-        if not provider['Effective_Date']:
+        if 'date' in found and 'effective_date' in needs:
             eff_date = extract_effective_date(line)
-            if eff_date:
-                provider['Effective_Date'] = eff_date
-                # Try to extract owner name (before effective date)
-                owner_match = re.match(r'^(.+?)\s+' + eff_date, line)
-                if owner_match:
-                    provider['Owner_Name'] = owner_match.group(1).strip()
-                break
-
-    # Look for phone in any line (typically line 4, but search all to be safe)
-    for line in lines:
-        if not provider['Phone']:
-            phone = extract_phone(line)
-            if phone:
-                provider['Phone'] = phone
-                break
-
-    # Extract subsidy info from lines that contain those questions
-    for line in lines:
-        if 'Currently Accepts Subsidy?' in line and not provider['Currently_Accepts_Subsidy']:
-            provider['Currently_Accepts_Subsidy'] = extract_yn_value(line, 'Currently Accepts Subsidy?')
-        if 'Willing To Accept Subsidy?' in line and not provider['Willing_To_Accept_Subsidy']:
-            provider['Willing_To_Accept_Subsidy'] = extract_yn_value(line, 'Willing To Accept Subsidy?')
-        if 'Does Not Accept Subsidy?' in line and not provider['Does_Not_Accept_Subsidy']:
-            provider['Does_Not_Accept_Subsidy'] = extract_yn_value(line, 'Does Not Accept Subsidy?')
-        if 'Step Up To Quality:' in line and not provider['Step_Up_Quality']:
-            provider['Step_Up_Quality'] = extract_step_up_quality(line)
-        if 'Accredited?' in line and not provider['Accredited']:
-            provider['Accredited'] = extract_accredited(line)
+            provider.effective_date = eff_date
+            needs.discard('effective_date')
+            # Try to extract owner name (before effective date)
+            owner_match = re.match(r'^(.+?)\s+' + eff_date, line)
+            if owner_match:
+                provider.owner_name = owner_match.group(1).strip()
+
+        if 'phone' in found and 'phone' in needs:
+            provider.phone = extract_phone(line)
+            needs.discard('phone')
+
+        # Subsidy, quality and accreditation questions
+        for question in questions:
+            field, extract = _QUESTION_FIELDS[question]
+            if field in needs:
+                value = extract(line)
+                if value:
+                    setattr(provider, field, value)
+                    needs.discard(field)
 
     return provider
 
@@ -382,130 +497,190 @@ def is_provider_start_line(line):
     Check if a line is the start of a new provider entry.
     Provider lines contain a license number pattern.
     """
-    # Must have a license number and Capacity
-    has_license = bool(re.search(r'\b(FII?\d+|CCC\d+|PRE\d+|SAOC\d+)\b', line))
-    has_capacity = 'Capacity:' in line
-    return has_license and has_capacity
+    # Must have Capacity and a license number.  Most lines lack "Capacity:",
+    # so check that first and only run the regex on likely candidates.
+    return 'Capacity:' in line and _LICENSE_RE.search(line) is not None
 
 
 def is_zip_header(line):
     """
     Check if line is a ZIP code header like '68002 Washington'.
     """
-    match = re.match(r'^(\d{5})\s+([A-Za-z]+)\s*$', line)
+    # Cheap guard: headers start with the 5-digit ZIP
+    if not line[:5].isdigit():
+        return None
+    match = _ZIP_HEADER_RE.match(line)
     return match
 
 
-def extract_providers_from_pdf(pdf_path, download_date=''):
+def _extract_page_range(pdf_path, start, stop):
     """
-    Extract all provider records from the PDF.
+    Extract the text of pages [start, stop) of the PDF.
 
-    Args:
-        pdf_path: Path to the PDF file to parse.
-        download_date: Optional date string (YYYY-MM-DD) to include in each record.
+    Runs in a worker process, so it opens its own handle on the PDF.
+    """
+    texts = []
+    # pdfplumber is slower than pypdfium2 or PyMuPDF, but the parser depends
+    # on its line reconstruction (characters grouped by vertical position).
+    # pypdfium2 returns text in content-stream order and PyMuPDF splits the
+    # overlapping owner/date columns differently, so either backend changes
+    # the parsed records.
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            texts.append(page.extract_text())
+            # Release the page's parsed layout objects once we have its text,
+            # otherwise pdfplumber keeps every page's objects alive until the
+            # document is closed.
+            page.close()
+    return texts
+
+
+def extract_page_texts(pdf_path, start=0, stop=None, max_workers=None):
+    """
+    Extract the text of pages [start, stop), in page order.  `stop` defaults
+    to the end of the document.
+
+    Text extraction dominates the run time and each page is independent, so
+    pages are split into chunks and extracted across worker processes.  ZIP
+    and county context carries across page boundaries, which is why only the
+    extraction is parallel and parsing stays a single pass over the result.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        num_pages = len(pdf.pages)
+    if stop is not None:
+        num_pages = min(stop, num_pages)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    chunks = [
+        (first, min(first + PAGES_PER_WORKER_TASK, num_pages))
+        for first in range(start, num_pages, PAGES_PER_WORKER_TASK)
+    ]
+
+    if max_workers <= 1 or len(chunks) <= 1:
+        results = [_extract_page_range(pdf_path, first, last) for first, last in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _extract_page_range,
+                [pdf_path] * len(chunks),
+                [first for first, _ in chunks],
+                [last for _, last in chunks],
+            )
+            results = list(results)
+
+    return [text for chunk in results for text in chunk]
+
+
+def parse_page_texts(page_texts, download_date=''):
+    """
+    Parse provider records out of already-extracted page texts, in page order.
 
-    Returns a list of dictionaries, one per provider.
+    ZIP/county context carries from one page to the next, so providers before
+    the first ZIP header in `page_texts` have none.
     """
     providers = []
     current_zip = ''
     current_county = ''
 
-    with pdfplumber.open(pdf_path) as pdf:
-        # Skip first page (title/intro)
-        for page_num, page in enumerate(pdf.pages[1:], start=2):
-            text = page.extract_text()
-            if not text:
-                continue
+    for text in page_texts:
+        if not text:
+            continue
 
-            lines = [l.strip() for l in text.split('\n') if l.strip()]
-
-            i = 0
-            while i < len(lines):
-                line = lines[i]
-
-                # Skip header lines
-                if any(skip in line for skip in [
-                    'CHILD CARE LICENSING ROSTER',
-                    'Date of Printing:',
-                    'ZIP CODE',
-                    'PROVIDER NAME',
-                    'OWNER NAME',
-                    'PHONE NUMBER',
-                ]):
-                    i += 1
-                    continue
+        lines = [l for l in (s.strip() for s in text.split('\n')) if l]
 
-                # Check for ZIP code header
-                zip_match = is_zip_header(line)
-                if zip_match:
-                    current_zip = zip_match.group(1)
-                    current_county = zip_match.group(2)
-                    i += 1
-                    continue
+        i = 0
+        while i < len(lines):
+            line = lines[i]
 
-                # Check for Total line
-                if line.startswith('Total Number in Zip Code:'):
-                    i += 1
-                    continue
+            # Skip header lines
+            if line.startswith(_SKIP_PREFIXES):
+                i += 1
+                continue
 
-                # Check if this is a provider start line
-                if is_provider_start_line(line):
-                    # Collect lines for this provider (typically 8 lines)
-                    provider_lines = [line]
-                    i += 1
+            # Check for ZIP code header
+            zip_match = is_zip_header(line)
+            if zip_match:
+                current_zip = zip_match.group(1)
+                current_county = zip_match.group(2)
+                i += 1
+                continue
 
-                    # Collect subsequent lines until we hit another provider or special line
-                    lines_collected = 1
-                    while i < len(lines) and lines_collected < 10:
-                        next_line = lines[i]
-
-                        # Stop if we hit a new provider, zip header, or total
-                        if is_provider_start_line(next_line):
-                            break
-                        if is_zip_header(next_line):
-                            break
-                        if next_line.startswith('Total Number in Zip Code:'):
-                            break
-                        if any(skip in next_line for skip in [
-                            'CHILD CARE LICENSING ROSTER',
-                            'Date of Printing:',
-                            'ZIP CODE',
-                            'PROVIDER NAME',
-                            'OWNER NAME',
-                            'PHONE NUMBER',
-                        ]):
-                            break
-
-                        provider_lines.append(next_line)
-                        i += 1
-                        lines_collected += 1
-
-                    # Parse the provider block
-                    provider = parse_provider_block(provider_lines, current_zip, current_county, download_date)
-                    if provider['Provider_Name'] or provider['License_Number']:
-                        providers.append(provider)
-                else:
+            # Check for Total line
+            if line.startswith('Total Number in Zip Code:'):
+                i += 1
+                continue
+
+            # Check if this is a provider start line
+            if is_provider_start_line(line):
+                # Collect lines for this provider (typically 8 lines)
+                provider_lines = [line]
+                i += 1
+
+                # Collect subsequent lines until we hit another provider or special line
+                lines_collected = 1
+                while i < len(lines) and lines_collected < 10:
+                    next_line = lines[i]
+
+                    # Stop if we hit a new provider, zip header, or total
+                    if is_provider_start_line(next_line):
+                        break
+                    if is_zip_header(next_line):
+                        break
+                    if next_line.startswith('Total Number in Zip Code:'):
+                        break
+                    if next_line.startswith(_SKIP_PREFIXES):
+                        break
+
+                    provider_lines.append(next_line)
                     i += 1
+                    lines_collected += 1
+
+                # Parse the provider block
+                provider = parse_provider_block(provider_lines, current_zip, current_county, download_date)
+                if provider.provider_name or provider.license_number:
+                    providers.append(provider)
+            else:
+                i += 1
 
     return providers
 
 
+def extract_providers_from_pdf(pdf_path, download_date=''):
+    """
+    Extract all provider records from the PDF.
+
+    Args:
+        pdf_path: Path to the PDF file to parse.
+        download_date: Optional date string (YYYY-MM-DD) to include in each record.
+
+    Returns a list of Provider records, one per provider.
+    """
+    # Skip first page (title/intro)
+    page_texts = extract_page_texts(pdf_path, start=1)
+
+    return parse_page_texts(page_texts, download_date)
+
+
+def provider_columns(providers):
+    """
+    Transpose Provider records into one list per field, keyed by attribute
+    name, so checks that look at a single field can run over a flat list.
+    """
+    if not providers:
+        return {name: [] for name in PROVIDER_FIELDS}
+    return dict(zip(PROVIDER_FIELDS, map(list, zip(*map(_provider_row, providers)))))
+
+
 def write_csv(providers, output_path):
     """
     Write providers to CSV file.
     """
-    fieldnames = [
-        'Download_Date', 'Zip_Code', 'County', 'Provider_Name', 'License_Number',
-        'License_Type', 'Owner_Name', 'Effective_Date', 'Address', 'City', 'State',
-        'Phone', 'Capacity', 'Ages', 'Hours', 'Days_Open',
-        'Currently_Accepts_Subsidy', 'Willing_To_Accept_Subsidy',
-        'Does_Not_Accept_Subsidy', 'Step_Up_Quality', 'Accredited'
-    ]
-
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(providers)
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(map(_provider_row, providers))
 
     print(f"Wrote {len(providers)} providers to {output_path}")
 
@@ -3,15 +3,20 @@
 Consistency tests for Nebraska DHHS Child Care Roster parsing.
 
 These tests validate that:
-1. Parsing the same PDF twice produces identical results
+1. Re-parsing sampled pages of the same PDF produces identical results
 2. Extracted data matches expected patterns and formats
 3. Provider counts are reasonable
 4. Required fields are populated
 """
 
+import random
 import re
 from collections import Counter
 
+import pdfplumber
+
+from parse_childcare_roster import extract_page_texts, parse_page_texts, provider_columns
+
 
 # Expected patterns for validation
 LICENSE_PATTERN = re.compile(r'^(FII?\d+|CCC\d+|PRE\d+|SAOC\d+)$')
@@ -33,6 +38,10 @@ VALID_LICENSE_TYPES = {
 # Minimum expected providers (safeguard against empty/broken parsing)
 MIN_EXPECTED_PROVIDERS = 100
 
+# Page ranges re-parsed by the determinism test, and pages in each range
+DETERMINISM_SAMPLE_RANGES = 3
+DETERMINISM_PAGES_PER_RANGE = 2
+
 
 class ConsistencyTestResult:
     """Result of a consistency test run."""
@@ -75,44 +84,85 @@ class ConsistencyTestResult:
         return '\n'.join(lines)
 
 
-def test_parsing_determinism(pdf_path, parse_func, download_date=''):
+def test_parsing_determinism(pdf_path, parse_func, download_date='', providers=None,
+                             sample_ranges=DETERMINISM_SAMPLE_RANGES):
     """
-    Test that parsing the same PDF twice produces identical results.
+    Test that re-parsing the same PDF produces identical results.
+
+    Rather than parsing the whole PDF a second time, the text of a few
+    randomly chosen page ranges is extracted once and parsed twice.  Both
+    parses must agree, and every provider found must match the record from
+    the full parse with the same license number.
+
+    The two parses of a sample run in the same process over identical page
+    text (with clean_provider_name answering repeats from its cache), so
+    they check that parsing is a stable function of the extracted text
+    rather than acting as independent runs.  Comparing against the full
+    parse covers extraction.
 
     Args:
         pdf_path: Path to PDF file
-        parse_func: Function to parse PDF (extract_providers_from_pdf)
+        parse_func: Function to parse PDF (extract_providers_from_pdf), used
+            when `providers` is not given
         download_date: Date string to pass to parser
+        providers: Providers from the full parse (parsed here if not given)
+        sample_ranges: Number of page ranges to re-parse
 
     Returns:
         ConsistencyTestResult
     """
     result = ConsistencyTestResult()
 
-    # Parse twice
-    providers1 = parse_func(pdf_path, download_date=download_date)
-    providers2 = parse_func(pdf_path, download_date=download_date)
+    if providers is None:
+        providers = parse_func(pdf_path, download_date=download_date)
 
-    # Check count matches
-    if len(providers1) != len(providers2):
-        result.add_error(
-            f"Provider count differs between runs: {len(providers1)} vs {len(providers2)}"
-        )
-        return result
+    result.stats['provider_count'] = len(providers)
 
-    result.stats['provider_count'] = len(providers1)
+    by_license = {}
+    for p in providers:
+        by_license.setdefault(p.license_number, []).append(p)
 
-    # Check each provider matches
+    with pdfplumber.open(pdf_path) as pdf:
+        num_pages = len(pdf.pages)
+
+    # Page 1 is the title page and is never parsed.  Windows start on a
+    # multiple of the window size so sampled ranges never overlap.
+    starts = range(1, max(num_pages - DETERMINISM_PAGES_PER_RANGE, 1) + 1, DETERMINISM_PAGES_PER_RANGE)
+    sampled = sorted(random.sample(starts, min(sample_ranges, len(starts))))
+    result.stats['determinism_sampled_pages'] = ', '.join(
+        f"{start + 1}-{start + DETERMINISM_PAGES_PER_RANGE}" for start in sampled
+    )
+
+    checked = 0
     mismatches = 0
-    for i, (p1, p2) in enumerate(zip(providers1, providers2)):
-        if p1 != p2:
-            mismatches += 1
-            if mismatches <= 3:  # Only report first few
-                result.add_error(f"Provider {i} differs between runs")
+    for start in sampled:
+        stop = start + DETERMINISM_PAGES_PER_RANGE
+        page_texts = extract_page_texts(pdf_path, start=start, stop=stop)
+
+        sampled_providers = parse_page_texts(page_texts, download_date)
+        if sampled_providers != parse_page_texts(page_texts, download_date):
+            result.add_error(f"Pages {start + 1}-{stop} parse differently between runs")
+
+        for p in sampled_providers:
+            # Providers before the range's first ZIP header lack ZIP/county
+            # context, so they can't be compared with the full parse.
+            if not p.zip_code:
+                continue
+
+            checked += 1
+            if p not in by_license.get(p.license_number, []):
+                mismatches += 1
+                if mismatches <= 3:  # Only report first few
+                    result.add_error(
+                        f"Provider {p.license_number or p.provider_name} "
+                        f"on pages {start + 1}-{stop} differs from the full parse"
+                    )
 
     if mismatches > 3:
         result.add_error(f"... and {mismatches - 3} more mismatches")
 
+    result.stats['determinism_providers_checked'] = checked
+
     return result
 
 
@@ -121,7 +171,7 @@ def test_data_quality(providers):
     Test that extracted data meets quality standards.
 
     Args:
-        providers: List of provider dictionaries
+        providers: List of Provider records
 
     Returns:
         ConsistencyTestResult
@@ -135,42 +185,31 @@ def test_data_quality(providers):
 
     result.stats['total_providers'] = len(providers)
 
-    # Track field statistics
-    license_types = Counter()
-    invalid_licenses = []
-    invalid_phones = []
-    invalid_dates = []
-    invalid_zips = []
-    missing_names = 0
-    missing_license_numbers = 0
-
-    for i, p in enumerate(providers):
-        # Check required fields
-        if not p.get('Provider_Name'):
-            missing_names += 1
-
-        if not p.get('License_Number'):
-            missing_license_numbers += 1
-        elif not LICENSE_PATTERN.match(p['License_Number']):
-            invalid_licenses.append((i, p['License_Number']))
-
-        # Track license types
-        if p.get('License_Type'):
-            license_types[p['License_Type']] += 1
-            if p['License_Type'] not in VALID_LICENSE_TYPES:
-                result.add_warning(f"Unknown license type: {p['License_Type']}")
-
-        # Validate phone format (if present)
-        if p.get('Phone') and not PHONE_PATTERN.match(p['Phone']):
-            invalid_phones.append((i, p['Phone']))
-
-        # Validate date format (if present)
-        if p.get('Effective_Date') and not DATE_PATTERN.match(p['Effective_Date']):
-            invalid_dates.append((i, p['Effective_Date']))
-
-        # Validate ZIP format (if present)
-        if p.get('Zip_Code') and not ZIP_PATTERN.match(p['Zip_Code']):
-            invalid_zips.append((i, p['Zip_Code']))
+    # Validate column by column
+    columns = provider_columns(providers)
+    names = columns['provider_name']
+    licenses = columns['license_number']
+    types = columns['license_type']
+    phones = columns['phone']
+    dates = columns['effective_date']
+    zips = columns['zip_code']
+
+    # Check required fields.  Missing values are empty strings, so counting
+    # them is a single list.count per column.
+    missing_names = names.count('')
+    missing_license_numbers = licenses.count('')
+    invalid_licenses = [(i, lic) for i, lic in enumerate(licenses) if lic and not LICENSE_PATTERN.match(lic)]
+
+    # Track license types
+    license_types = Counter(t for t in types if t)
+    for t in types:
+        if t and t not in VALID_LICENSE_TYPES:
+            result.add_warning(f"Unknown license type: {t}")
+
+    # Validate phone, date and ZIP formats (if present)
+    invalid_phones = [(i, v) for i, v in enumerate(phones) if v and not PHONE_PATTERN.match(v)]
+    invalid_dates = [(i, v) for i, v in enumerate(dates) if v and not DATE_PATTERN.match(v)]
+    invalid_zips = [(i, v) for i, v in enumerate(zips) if v and not ZIP_PATTERN.match(v)]
 
     # Report issues
     if missing_names > 0:
@@ -205,8 +244,8 @@ def test_data_quality(providers):
 
     # Add stats
     result.stats['license_type_distribution'] = dict(license_types)
-    result.stats['providers_with_phone'] = sum(1 for p in providers if p.get('Phone'))
-    result.stats['providers_with_address'] = sum(1 for p in providers if p.get('Address'))
+    result.stats['providers_with_phone'] = len(phones) - phones.count('')
+    result.stats['providers_with_address'] = len(columns['address']) - columns['address'].count('')
 
     return result
 
@@ -216,7 +255,7 @@ def test_field_completeness(providers, required_rate=0.90):
     Test that key fields are populated at expected rates.
 
     Args:
-        providers: List of provider dictionaries
+        providers: List of Provider records
         required_rate: Minimum proportion that must have the field (0.0-1.0)
 
     Returns:
@@ -234,8 +273,11 @@ def test_field_completeness(providers, required_rate=0.90):
         'Capacity',
     ]
 
+    columns = provider_columns(providers)
+
     for field in key_fields:
-        populated = sum(1 for p in providers if p.get(field))
+        column = columns[field.lower()]
+        populated = len(column) - column.count('')
         rate = populated / len(providers) if providers else 0
         result.stats[f'{field}_rate'] = f"{rate:.1%}"
 
@@ -282,7 +324,9 @@ def run_all_tests(pdf_path, providers, parse_func=None, download_date=''):
     # Test 3: Parsing determinism (if parse function provided)
     if parse_func:
         print("  - Testing parsing determinism...")
-        determinism_result = test_parsing_determinism(pdf_path, parse_func, download_date)
+        determinism_result = test_parsing_determinism(
+            pdf_path, parse_func, download_date, providers=providers
+        )
         combined.errors.extend(determinism_result.errors)
         combined.warnings.extend(determinism_result.warnings)
         # Don't duplicate provider_count if already present